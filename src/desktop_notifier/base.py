@@ -6,8 +6,8 @@ must inherit from :class:`DesktopNotifierBase`.
 from __future__ import annotations
 
 import logging
+import re
 from urllib.parse import urlparse, unquote
-import urllib.parse
 import warnings
 import dataclasses
 from dataclasses import dataclass
@@ -148,6 +148,23 @@ class Sound(Resource):
     pass
 
 
+# URI scheme as defined in RFC 3986, followed by an authority component.
+_uri_scheme_pattern = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+
+
+def icon_from_str(value: str) -> Icon:
+    """
+    Converts a string to an icon. Strings with a URI scheme such as ``file://`` are
+    interpreted as URIs, all other strings as icon names.
+
+    :param value: Icon URI or name.
+    :returns: The corresponding icon.
+    """
+    if _uri_scheme_pattern.match(value):
+        return Icon(uri=value)
+    return Icon(name=value)
+
+
 DEFAULT_ICON: Icon = Icon(path=python_icon_path)
 """Python icon"""
 
@@ -214,30 +231,30 @@ class Notification:
     message: str
     """Notification message"""
 
-    urgency: Urgency
+    urgency: Urgency = Urgency.Normal
     """Notification urgency. Can determine stickiness, notification appearance and
     break through silencing."""
 
-    icon: Icon | None
+    icon: Icon | None = None
     """Icon to use for the notification"""
 
-    buttons: tuple[Button, ...]
+    buttons: tuple[Button, ...] = ()
     """Buttons shown on an interactive notification"""
 
-    reply_field: ReplyField | None
+    reply_field: ReplyField | None = None
     """Text field shown on an interactive notification. This can be used for example
     for messaging apps to reply directly from the notification."""
 
-    on_clicked: Callable[[], Any] | None
+    on_clicked: Callable[[], Any] | None = None
     """Method to call when the notification is clicked"""
 
-    on_dismissed: Callable[[], Any] | None
+    on_dismissed: Callable[[], Any] | None = None
     """Method to call when the notification is dismissed"""
 
-    attachment: Attachment | None
+    attachment: Attachment | None = None
     """A file attached to the notification which may be displayed as a preview"""
 
-    sound: Sound | None
+    sound: Sound | None = None
     """A sound to play on notification"""
 
     thread: str | None = None
@@ -281,10 +298,7 @@ class Notification:
                 "Support for string input will be removed in a future release.",
                 category=DeprecationWarning,
             )
-            if urllib.parse.urlparse(icon).hostname != "":
-                icon = Icon(uri=icon)
-            else:
-                icon = Icon(name=icon)
+            icon = icon_from_str(icon)
         if isinstance(attachment, str):
             warnings.warn(
                 message="Pass an Attachment instance instead of a string. "
@@ -311,6 +325,32 @@ class Notification:
         self.thread = thread
         self.timeout = timeout
 
+    @classmethod
+    def quick(cls, title: str, message: str, icon: Icon | None = None) -> Notification:
+        """
+        Creates a notification with only a title, message and icon, using defaults for
+        all other properties. This is equivalent to but faster than calling the
+        constructor with keyword arguments.
+
+        :param title: Notification title.
+        :param message: Notification message.
+        :param icon: Icon to use for the notification.
+        :returns: The new notification instance.
+        """
+        # All other properties fall back to their class-level defaults.
+        self = cls.__new__(cls)
+
+        self._identifier = ""
+        self._winrt_identifier = ""
+        self._macos_identifier = ""
+        self._dbus_identifier = 0
+
+        self.title = title
+        self.message = message
+        self.icon = icon
+
+        return self
+
     @property
     def identifier(self) -> str:
         """Unique identifier for this notification
@@ -450,6 +490,18 @@ class DesktopNotifierBase(ABC):
             self._current_notifications.append(notification)
             self._notification_for_nid[notification.identifier] = notification
 
+    async def send_many(self, notifications: Sequence[Notification]) -> None:
+        """
+        Sends multiple desktop notifications at once. Backends which can deliver several
+        notifications in a single call to the platform may override this method. The
+        default implementation calls :meth:`send` for one notification after another
+        so that replacements due to :attr:`notification_limit` are accounted for.
+
+        :param notifications: Notifications to send.
+        """
+        for notification in notifications:
+            await self.send(notification)
+
     def _clear_notification_from_cache(self, notification: Notification) -> None:
         """
         Removes the notification from our cache. Should be called by backends when the
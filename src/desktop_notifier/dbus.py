@@ -8,6 +8,7 @@ interaction with a notification requires a running asyncio event loop.
 from __future__ import annotations
 
 # system imports
+import asyncio
 import logging
 from typing import TypeVar
 
@@ -71,6 +72,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
     ) -> None:
         super().__init__(app_name, notification_limit)
         self.interface: ProxyInterface | None = None
+        self._interface_future: asyncio.Future[ProxyInterface] | None = None
 
     async def request_authorisation(self) -> bool:
         """
@@ -86,6 +88,23 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         """
         return True
 
+    async def _get_interface(self) -> ProxyInterface:
+        """
+        Returns the Dbus interface, connecting on first use. Concurrent callers share a
+        single connection attempt.
+        """
+        if self._interface_future is None:
+            self._interface_future = asyncio.ensure_future(self._init_dbus())
+            self._interface_future.add_done_callback(self._on_init_dbus_done)
+
+        return await asyncio.shield(self._interface_future)
+
+    def _on_init_dbus_done(self, future: asyncio.Future[ProxyInterface]) -> None:
+        # Forget a failed connection attempt so that the next call tries again.
+        if future.cancelled() or future.exception() is not None:
+            if self._interface_future is future:
+                self._interface_future = None
+
     async def _init_dbus(self) -> ProxyInterface:
         self.bus = await MessageBus().connect()
         introspection = await self.bus.introspect(
@@ -121,7 +140,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         :param notification_to_replace: Notification to replace, if any.
         """
         if not self.interface:
-            self.interface = await self._init_dbus()
+            self.interface = await self._get_interface()
 
         if notification_to_replace:
             replaces_nid = identifier_to_dbus(notification_to_replace.identifier)
@@ -218,12 +237,17 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         if not self.interface:
             return
 
-        for notification in self.current_notifications:
-            # dbus_next proxy APIs are generated at runtime. Silence the type checker
-            # but raise an AttributeError if required.
-            await self.interface.call_close_notification(  # type:ignore[attr-defined]
-                identifier_to_dbus(notification.identifier)
+        # Close all notifications concurrently instead of waiting for each reply in
+        # turn. dbus_next proxy APIs are generated at runtime. Silence the type checker
+        # but raise an AttributeError if required.
+        await asyncio.gather(
+            *(
+                self.interface.call_close_notification(  # type:ignore[attr-defined]
+                    identifier_to_dbus(notification.identifier)
+                )
+                for notification in self.current_notifications
             )
+        )
 
     # Note that _on_action and _on_closed might be called for the same notification
     # with some notification servers. This is not a problem because the _on_action
@@ -278,7 +302,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
 
     async def get_capabilities(self) -> frozenset[Capability]:
         if not self.interface:
-            self.interface = await self._init_dbus()
+            self.interface = await self._get_interface()
 
         capabilities = {
             Capability.APP_NAME,
@@ -9,10 +9,11 @@ import platform
 import logging
 import asyncio
 import warnings
-from urllib import parse
 from pathlib import Path
 from typing import (
     Type,
+    Dict,
+    Set,
     Callable,
     List,
     Any,
@@ -20,9 +21,6 @@ from typing import (
     Sequence,
 )
 
-# external imports
-from packaging.version import Version
-
 # local imports
 from .base import (
     Capability,
@@ -34,6 +32,7 @@ from .base import (
     Attachment,
     Notification,
     DesktopNotifierBase,
+    icon_from_str,
     DEFAULT_SOUND,
     DEFAULT_ICON,
 )
@@ -56,18 +55,37 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_DEFAULT_URGENCY = Urgency.Normal
+
+# Capabilities are a property of the backend, not of the notifier instance. Cache them
+# per backend class to avoid repeated IPC calls when creating multiple notifiers.
+_capabilities_for_impl: Dict[Type[DesktopNotifierBase], frozenset[Capability]] = {}
+
 
-default_event_loop_policy = asyncio.DefaultEventLoopPolicy()
+_backend_cls: Type[DesktopNotifierBase] | None = None
 
 
 def get_implementation_class() -> Type[DesktopNotifierBase]:
     """
-    Return the backend class depending on the platform and version.
+    Return the backend class depending on the platform and version. The backend is
+    resolved and imported on the first call only since it does not change during the
+    lifetime of the process.
 
     :returns: A desktop notification backend suitable for the current platform.
-    :raises RuntimeError: when passing ``macos_legacy = True`` on macOS 12.0 and later.
     """
-    if platform.system() == "Darwin":
+    global _backend_cls
+
+    if _backend_cls is None:
+        _backend_cls = _resolve_implementation_class()
+
+    return _backend_cls
+
+
+def _resolve_implementation_class() -> Type[DesktopNotifierBase]:
+    system = platform.system()
+
+    if system == "Darwin":
+        from packaging.version import Version
         from .macos_support import is_bundle, is_signed_bundle, macos_version
 
         has_unusernotificationcenter = macos_version >= Version("10.14")
@@ -92,22 +110,22 @@ def get_implementation_class() -> Type[DesktopNotifierBase]:
 
             return DummyNotificationCenter
 
-    elif platform.system() == "Linux":
+    elif system == "Linux":
         from .dbus import DBusDesktopNotifier
 
         return DBusDesktopNotifier
 
-    elif platform.system() == "Windows" and Version(platform.version()) >= Version(
-        "10.0.10240"
-    ):
-        from .winrt import WinRTDesktopNotifier
+    elif system == "Windows":
+        from packaging.version import Version
 
-        return WinRTDesktopNotifier
+        if Version(platform.version()) >= Version("10.0.10240"):
+            from .winrt import WinRTDesktopNotifier
 
-    else:
-        from .dummy import DummyNotificationCenter
+            return WinRTDesktopNotifier
 
-        return DummyNotificationCenter
+    from .dummy import DummyNotificationCenter
+
+    return DummyNotificationCenter
 
 
 class DesktopNotifier:
@@ -130,8 +148,23 @@ class DesktopNotifier:
         deprecated.
     :param notification_limit: Maximum number of notifications to keep in the system's
         notification center. This may be ignored by some implementations.
+    :param batch_window_ms: Time window in milliseconds during which notifications are
+        collected and then handed to the backend together. Defaults to zero which sends
+        every notification immediately.
     """
 
+    __slots__ = (
+        "app_icon",
+        "_impl",
+        "_auth_future",
+        "_capabilities",
+        "_batch_window_ms",
+        "_pending",
+        "_pending_future",
+        "_batch_tasks",
+        "__weakref__",
+    )
+
     app_icon: Icon | None
 
     def __init__(
@@ -139,23 +172,23 @@ class DesktopNotifier:
         app_name: str = "Python",
         app_icon: Icon | Path | str | None = DEFAULT_ICON,
         notification_limit: int | None = None,
+        batch_window_ms: float = 0,
     ) -> None:
         if isinstance(app_icon, str):
             warnings.warn(
                 message="Pass an Icon instance instead of a string. "
                 "Support for string input will be removed in a future release.",
                 category=DeprecationWarning,
+                stacklevel=2,
             )
-            if parse.urlparse(app_icon).hostname != "":
-                app_icon = Icon(uri=app_icon)
-            else:
-                app_icon = Icon(name=app_icon)
+            app_icon = icon_from_str(app_icon)
 
         if isinstance(app_icon, Path):
             warnings.warn(
                 message="Pass an Icon instance instead of a Path. "
                 "Support for string input will be removed in a future release.",
                 category=DeprecationWarning,
+                stacklevel=2,
             )
             app_icon = Icon(path=app_icon)
 
@@ -163,10 +196,15 @@ class DesktopNotifier:
 
         impl_cls = get_implementation_class()
         self._impl = impl_cls(app_name, notification_limit)
-        self._did_request_authorisation = False
+        self._auth_future: asyncio.Future[bool] | None = None
 
         self._capabilities: frozenset[Capability] | None = None
 
+        self._batch_window_ms = batch_window_ms
+        self._pending: List[Notification] = []
+        self._pending_future: asyncio.Future[None] | None = None
+        self._batch_tasks: Set[asyncio.Future[None]] = set()
+
     @property
     def app_name(self) -> str:
         """The application name"""
@@ -189,8 +227,17 @@ class DesktopNotifier:
 
         :returns: Whether authorisation has been granted.
         """
-        self._did_request_authorisation = True
-        return await self._impl.request_authorisation()
+        # Share the pending request with concurrent callers of send_notification.
+        future = asyncio.ensure_future(self._impl.request_authorisation())
+        future.add_done_callback(self._on_authorisation_done)
+        self._auth_future = future
+        return await asyncio.shield(future)
+
+    def _on_authorisation_done(self, future: asyncio.Future[bool]) -> None:
+        # Forget a failed request so that the next notification asks again.
+        if future.cancelled() or future.exception() is not None:
+            if self._auth_future is future:
+                self._auth_future = None
 
     async def has_authorisation(self) -> bool:
         """Returns whether we have authorisation to send notifications."""
@@ -212,27 +259,74 @@ class DesktopNotifier:
         :param notification: The notification to send.
         :returns: The passed notification instance with a unique identifier populated.
         """
-        if not notification.icon:
-            notification.icon = self.app_icon
+        notification.icon = notification.icon or self.app_icon
 
         # Ask for authorisation if not already done. On some platforms, this will
         # trigger a system dialog to ask the user for permission.
-        if not self._did_request_authorisation:
+        if self._auth_future is None:
             await self.request_authorisation()
         else:
             logger.debug("Notification center authorisation was already requested")
+            await asyncio.shield(self._auth_future)
 
         # We attempt to send the notification regardless of authorization.
         # The user may have changed settings in the meantime.
-        await self._impl.send(notification)
+        if self._batch_window_ms > 0:
+            await self._send_batched(notification)
+        else:
+            await self._impl.send(notification)
 
         return notification
 
+    async def _send_batched(self, notification: Notification) -> None:
+        """
+        Queues the notification for the current batch, arming the batch timer if
+        required, and waits until the batch has been handed to the backend.
+        """
+        if self._pending_future is None:
+            loop = asyncio.get_running_loop()
+            self._pending_future = loop.create_future()
+            loop.call_later(self._batch_window_ms / 1000, self._flush)
+
+        future = self._pending_future
+        self._pending.append(notification)
+        # Shield the shared future so that cancelling one sender does not cancel the
+        # batch for all others.
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Withdraw the notification if the batch has not been flushed yet.
+            if future is self._pending_future:
+                self._pending.remove(notification)
+            raise
+
+    def _flush(self) -> None:
+        """Sends all pending notifications as a single batch."""
+        batch, self._pending = self._pending, []
+        future, self._pending_future = self._pending_future, None
+
+        if future is not None:
+            task = asyncio.ensure_future(self._send_batch(batch, future))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(
+        self, batch: List[Notification], future: asyncio.Future[None]
+    ) -> None:
+        try:
+            await self._impl.send_many(batch)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(None)
+
     async def send(
         self,
         title: str,
         message: str,
-        urgency: Urgency = Urgency.Normal,
+        urgency: Urgency = _DEFAULT_URGENCY,
         icon: str | Icon | None = None,
         buttons: Sequence[Button] = (),
         reply_field: ReplyField | None = None,
@@ -252,6 +346,21 @@ class DesktopNotifier:
 
         :returns: The scheduled notification instance.
         """
+        if (
+            urgency is _DEFAULT_URGENCY
+            and icon is None
+            and not buttons
+            and reply_field is None
+            and on_clicked is None
+            and on_dismissed is None
+            and attachment is None
+            and sound is None
+            and thread is None
+            and timeout == -1
+        ):
+            notification = Notification.quick(title, message, self.app_icon)
+            return await self.send_notification(notification)
+
         notification = Notification(
             title,
             message,
@@ -292,6 +401,11 @@ class DesktopNotifier:
         """
         Returns which functionality is supported by the implementation.
         """
-        if not self._capabilities:
-            self._capabilities = await self._impl.get_capabilities()
+        if self._capabilities is None:
+            impl_cls = type(self._impl)
+            capabilities = _capabilities_for_impl.get(impl_cls)
+            if capabilities is None:
+                capabilities = await self._impl.get_capabilities()
+                _capabilities_for_impl[impl_cls] = capabilities
+            self._capabilities = capabilities
         return self._capabilities
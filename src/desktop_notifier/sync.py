@@ -6,6 +6,7 @@ from __future__ import annotations
 
 # system imports
 import asyncio
+import threading
 from typing import Callable, Coroutine, Any, Sequence, TypeVar, List
 
 # local imports
@@ -27,14 +28,55 @@ __all__ = ["DesktopNotifierSync"]
 
 T = TypeVar("T")
 
+_sync_loop: asyncio.AbstractEventLoop | None = None
+_sync_loop_lock = threading.Lock()
+
+
+def _new_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Creates the event loop for the sync API. This is a plain selector event loop on
+    all platforms, independent of any user-installed event loop policy, since it runs
+    in a worker thread. For instance, a CFRunLoop-based loop on macOS must run in the
+    main thread. Notifications also do not require the subprocess or pipe support of
+    the proactor event loop on Windows.
+    """
+    return asyncio.SelectorEventLoop()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop shared by all :class:`DesktopNotifierSync` instances. The loop
+    is created on first use and runs forever in a daemon thread.
+    """
+    global _sync_loop
+
+    if _sync_loop is not None:
+        return _sync_loop
+
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = _new_sync_loop()
+            thread = threading.Thread(
+                target=_sync_loop.run_forever,
+                name="desktop-notifier-sync-loop",
+                daemon=True,
+            )
+            thread.start()
+
+    return _sync_loop
+
 
 class DesktopNotifierSync:
     """
     A synchronous counterpart to :class:`desktop_notifier.main.DesktopNotifier`
 
+    All instances share a single asyncio event loop which runs in a daemon thread. On
+    Linux, callbacks on interaction with a notification are therefore executed in that
+    thread. Blocking methods of this class must not be called from such callbacks.
+
     .. warning::
-        Callbacks on interaction with the notification will not work on macOS or Linux
-        without a running event loop.
+        Callbacks on interaction with the notification will not work on macOS without a
+        running CFRunLoop in the main thread.
     """
 
     def __init__(
@@ -44,18 +86,24 @@ class DesktopNotifierSync:
         notification_limit: int | None = None,
     ) -> None:
         self._async_api = DesktopNotifier(app_name, app_icon, notification_limit)
-        self._loop = asyncio.new_event_loop()
 
     def _run_coro_sync(self, coro: Coroutine[None, None, T]) -> T:
         # Make sure to always use the same loop because async queues, future, etc. are
         # always bound to a loop.
-        if self._loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-            res = future.result()
-        else:
-            res = self._loop.run_until_complete(coro)
+        loop = _get_sync_loop()
+
+        try:
+            running_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            # Waiting for the result from the loop's own thread would deadlock.
+            coro.close()
+            raise RuntimeError("Cannot block on the event loop thread of the sync API")
 
-        return res
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result()
 
     @property
     def app_name(self) -> str:
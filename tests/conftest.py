@@ -12,11 +12,25 @@ if platform.system() == "Darwin":
     asyncio.set_event_loop_policy(EventLoopPolicy())
 
 
+async def skip_authorisation(dn: DesktopNotifier) -> None:
+    # Skip requesting authorization to void blocking if not granted.
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(True)
+    dn._auth_future = future
+
+
 @pytest_asyncio.fixture
 async def notifier():
     dn = DesktopNotifier()
-    # Skip requesting authorization to void blocking if not granted.
-    dn._did_request_authorisation = True
+    await skip_authorisation(dn)
+    yield dn
+    await dn.clear_all()
+
+
+@pytest_asyncio.fixture
+async def notifier_batched():
+    dn = DesktopNotifier(batch_window_ms=50)
+    await skip_authorisation(dn)
     yield dn
     await dn.clear_all()
 
@@ -24,7 +38,6 @@ async def notifier():
 @pytest.fixture
 def notifier_sync():
     dn = DesktopNotifierSync()
-    # Skip requesting authorization to void blocking if not granted.
-    dn._async_api._did_request_authorisation = True
+    dn._run_coro_sync(skip_authorisation(dn._async_api))
     yield dn
     dn.clear_all()
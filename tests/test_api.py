@@ -1,7 +1,9 @@
 import sys
+import asyncio
 import pytest
 
 from pathlib import Path
+import desktop_notifier.main
 from desktop_notifier import (
     Urgency,
     Button,
@@ -11,9 +13,23 @@ from desktop_notifier import (
     ReplyField,
     DEFAULT_SOUND,
     DEFAULT_ICON,
+    Notification,
+    DesktopNotifier,
 )
 
 
+def record_send_many(notifier, monkeypatch):
+    batches = []
+    send_many = notifier._impl.send_many
+
+    async def recording_send_many(notifications):
+        batches.append(list(notifications))
+        await send_many(notifications)
+
+    monkeypatch.setattr(notifier._impl, "send_many", recording_send_many)
+    return batches
+
+
 @pytest.mark.asyncio
 async def test_send(notifier):
     notification = await notifier.send(
@@ -50,6 +66,100 @@ async def test_default_icon(notifier):
     assert notification.icon == DEFAULT_ICON
 
 
+@pytest.mark.asyncio
+async def test_send_batched_notification_limit(monkeypatch):
+    notifier = DesktopNotifier(notification_limit=2, batch_window_ms=20)
+    replaced = []
+
+    async def request_authorisation():
+        return True
+
+    async def _send(notification, notification_to_replace):
+        replaced.append(notification_to_replace)
+        await asyncio.sleep(0.01)
+        notification.identifier = str(len(replaced))
+
+    monkeypatch.setattr(notifier._impl, "request_authorisation", request_authorisation)
+    monkeypatch.setattr(notifier._impl, "_send", _send)
+
+    notifications = await asyncio.gather(
+        *(
+            notifier.send(title="Julius Caesar", message="Et tu, Brute?")
+            for _ in range(5)
+        )
+    )
+    assert replaced == [None, None, *notifications[:3]]
+    assert notifier.current_notifications == notifications[3:]
+
+
+@pytest.mark.asyncio
+async def test_request_authorisation_once(monkeypatch):
+    notifier = DesktopNotifier()
+    calls = []
+
+    async def request_authorisation():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return True
+
+    monkeypatch.setattr(notifier._impl, "request_authorisation", request_authorisation)
+
+    t0 = asyncio.ensure_future(
+        notifier.send(title="Julius Caesar", message="Et tu, Brute?")
+    )
+    t1 = asyncio.ensure_future(
+        notifier.send(title="Julius Caesar", message="Et tu, Brute?")
+    )
+    await asyncio.sleep(0)
+    t0.cancel()
+    await t1
+    await notifier.send(title="Julius Caesar", message="Et tu, Brute?")
+
+    assert t0.cancelled()
+    assert len(calls) == 1
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("dialog-information", Icon(name="dialog-information")),
+        ("file:///blue", Icon(uri="file:///blue")),
+        ("x-icon+v2.0://blue", Icon(uri="x-icon+v2.0://blue")),
+        ("C:\\icon.png", Icon(name="C:\\icon.png")),
+    ],
+)
+def test_icon_from_str(value, expected):
+    assert Notification(title="", message="", icon=value).icon == expected
+    assert DesktopNotifier(app_icon=value).app_icon == expected
+
+
+@pytest.mark.asyncio
+async def test_get_capabilities_cached(monkeypatch):
+    monkeypatch.setattr(desktop_notifier.main, "_capabilities_for_impl", {})
+    calls = []
+
+    async def get_capabilities(self):
+        calls.append(self)
+        return frozenset()
+
+    n0 = DesktopNotifier()
+    n1 = DesktopNotifier()
+    monkeypatch.setattr(type(n0._impl), "get_capabilities", get_capabilities)
+
+    assert await n0.get_capabilities() == frozenset()
+    assert await n0.get_capabilities() == frozenset()
+    assert await n1.get_capabilities() == frozenset()
+    assert len(calls) == 1
+
+
+def test_notification_quick():
+    quick = Notification.quick(title="Julius Caesar", message="Et tu, Brute?")
+    full = Notification(title="Julius Caesar", message="Et tu, Brute?", sound=None)
+    for name in [*Notification.__annotations__, "identifier"]:
+        assert getattr(quick, name) == getattr(full, name)
+
+
 @pytest.mark.asyncio
 async def test_icon_name(notifier):
     await notifier.send(
@@ -146,3 +256,32 @@ async def test_clear_all(notifier):
 
     await notifier.clear_all()
     assert len(notifier.current_notifications) == 0
+
+
+@pytest.mark.asyncio
+async def test_send_batched(notifier_batched, monkeypatch):
+    batches = record_send_many(notifier_batched, monkeypatch)
+
+    n0, n1 = await asyncio.gather(
+        notifier_batched.send(title="Julius Caesar", message="Et tu, Brute?"),
+        notifier_batched.send(title="Julius Caesar", message="Et tu, Brute?"),
+    )
+    assert batches == [[n0, n1]]
+
+
+@pytest.mark.asyncio
+async def test_send_batched_cancel_one(notifier_batched, monkeypatch):
+    batches = record_send_many(notifier_batched, monkeypatch)
+
+    t0 = asyncio.ensure_future(
+        notifier_batched.send(title="Julius Caesar", message="Et tu, Brute?")
+    )
+    t1 = asyncio.ensure_future(
+        notifier_batched.send(title="Julius Caesar", message="Et tu, Brute?")
+    )
+    await asyncio.sleep(0)
+    t0.cancel()
+
+    n1 = await t1
+    assert t0.cancelled()
+    assert batches == [[n1]]
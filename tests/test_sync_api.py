@@ -64,3 +64,11 @@ def test_clear_all(notifier_sync):
 
     notifier_sync.clear_all()
     assert len(notifier_sync.current_notifications) == 0
+
+
+def test_blocking_call_on_loop_thread(notifier_sync):
+    async def call_blocking():
+        return notifier_sync.get_capabilities()
+
+    with pytest.raises(RuntimeError):
+        notifier_sync._run_coro_sync(call_blocking())